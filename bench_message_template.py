@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+消息模板渲染基准测试
+模拟一次提醒向500个sid群发时的渲染开销，不依赖 AstrBot，可直接运行:
+    python bench_message_template.py
+"""
+
+import timeit
+
+from message_template import MessageTemplate
+
+SID_COUNT = 500
+GROUP_COUNT = 10
+ROUNDS = 200
+
+SIDS = [f"wechatpadpro:GroupMessage:{i}@chatroom" for i in range(SID_COUNT)]
+VARIABLES = {
+    "name": "zuhui",
+    "date": "2025-07-24",
+    "time": "19:00",
+    "weekday": "周四",
+    "n": 3,
+    "total": 100,
+    "remaining": 97,
+    "room": "B302",
+}
+# 每个sid按所在小组覆盖 room 变量
+SID_VARS = {sid: {"room": f"B{300 + i % GROUP_COUNT}"} for i, sid in enumerate(SIDS)}
+
+CASES = [
+    (
+        "不含sid变量",
+        "{date} {weekday} 第{n}/{total}次组会，还剩{remaining}次，地点{room}",
+        None,
+    ),
+    (
+        f"按sid覆盖({GROUP_COUNT}组)",
+        "{date} {weekday} 第{n}/{total}次组会，还剩{remaining}次，地点{room}",
+        SID_VARS,
+    ),
+    (
+        "含{sid}变量",
+        "@{sid} {date} 第{n:02d}次组会，还剩{remaining}次",
+        None,
+    ),
+]
+
+
+def naive_render(source, sid_vars):
+    """对照组：每个sid都用 str.format 重新渲染"""
+    for sid in SIDS:
+        values = dict(VARIABLES, sid=sid)
+        if sid_vars and sid in sid_vars:
+            values.update(sid_vars[sid])
+        source.format(**values)
+
+
+def main():
+    print(f"sid数量: {SID_COUNT}，每项重复 {ROUNDS} 次，单位: 微秒/次提醒")
+    print(f"{'场景':<16}{'编译':>10}{'预编译+缓存':>14}{'逐个format':>14}{'实际渲染数':>10}")
+    for label, source, sid_vars in CASES:
+        extra = ["room"]
+        compile_us = (
+            timeit.timeit(lambda: MessageTemplate(source, extra), number=ROUNDS)
+            / ROUNDS
+            * 1e6
+        )
+        template = MessageTemplate(source, extra)
+        cached_us = (
+            timeit.timeit(
+                lambda: template.render_for_sids(SIDS, VARIABLES, sid_vars),
+                number=ROUNDS,
+            )
+            / ROUNDS
+            * 1e6
+        )
+        naive_us = (
+            timeit.timeit(lambda: naive_render(source, sid_vars), number=ROUNDS)
+            / ROUNDS
+            * 1e6
+        )
+        rendered = len(
+            {m for _, m in template.render_for_sids(SIDS, VARIABLES, sid_vars)}
+        )
+        print(
+            f"{label:<16}{compile_us:>10.1f}{cached_us:>14.1f}{naive_us:>14.1f}{rendered:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,13 @@ from astrbot.api.event import filter, AstrMessageEvent
 from astrbot.api.star import Context, Star, register
 from astrbot.api import logger
 
+from .message_template import (
+    WEEKDAYS,
+    MessageTemplate,
+    TemplateError,
+    compile_reminder_template,
+)
+
 
 @register("meeting_manager", "Ausert", "课题组组会管理工具", "0.0.2")
 class meeting_manager(Star):
@@ -17,6 +24,7 @@ class meeting_manager(Star):
         self.reminder_timers: Dict[str, asyncio.TimerHandle] = {}
         self.config_data: Dict[str, Any] = {}
         self.reminder_info: Dict[str, Dict[str, Any]] = {}  # 合并的提醒信息
+        self.reminder_templates: Dict[str, MessageTemplate] = {}  # 预编译的消息模板
         self.config_file = "config.py"
         self.dynamic_config_file = "dynamic_config.py"
 
@@ -39,6 +47,20 @@ class meeting_manager(Star):
         """删除提醒信息"""
         if name in self.reminder_info:
             del self.reminder_info[name]
+        self.reminder_templates.pop(name, None)
+
+    def _compile_reminder_template(self, name: str, reminder_config: Dict[str, Any]):
+        """编译提醒消息模板，模板无效时按原文发送"""
+        try:
+            template = compile_reminder_template(reminder_config)
+        except TemplateError as e:
+            logger.warning(f"提醒 {name} 的消息模板无效，将按原文发送: {e}")
+            message = str(reminder_config.get("message", "提醒时间到了！"))
+            template = MessageTemplate(
+                message.replace("{", "{{").replace("}", "}}")
+            )
+        self.reminder_templates[name] = template
+        return template
 
     def _add_reminder_to_config(self, name: str, reminder_config: Dict[str, Any]):
         """添加提醒到配置"""
@@ -201,6 +223,12 @@ config = {{
         if not message or not message.strip():
             return False, "提醒消息不能为空"
 
+        # 检查消息模板
+        try:
+            MessageTemplate(message)
+        except TemplateError as e:
+            return False, f"消息模板错误: {e}"
+
         return True, "参数验证通过"
 
     def _parse_command_parts(self, message_str: str, expected_parts: int) -> List[str]:
@@ -377,32 +405,95 @@ config = {{
             logger.error(f"解析重复时间失败: {e}")
             return datetime.timedelta(days=1)
 
-    def calculate_next_reminder_time(
+    def _calculate_scheduled_time(
         self, base_time: datetime.datetime, repeat_interval: datetime.timedelta
     ) -> datetime.datetime:
-        """计算下次提醒时间"""
+        """计算下次提醒的计划时间（不含随机延迟）"""
         now = datetime.datetime.now()
-        if base_time <= now:
+        if base_time <= now and repeat_interval.total_seconds() > 0:
             # 如果基础时间已过，计算下一个符合的时间点
             time_diff = now - base_time
             intervals_passed = time_diff // repeat_interval + 1
-            next_time = base_time + (repeat_interval * intervals_passed)
-        else:
-            next_time = base_time
+            return base_time + (repeat_interval * intervals_passed)
+        return base_time
 
-        # 随机调整1~40秒
-        random_adjustment = random.randint(1, 40)
-        next_time = next_time + datetime.timedelta(seconds=random_adjustment)
+    def calculate_next_reminder_time(
+        self, base_time: datetime.datetime, repeat_interval: datetime.timedelta
+    ) -> datetime.datetime:
+        """计算下次提醒时间"""
+        return self._add_random_delay(
+            self._calculate_scheduled_time(base_time, repeat_interval)
+        )
 
-        return next_time
+    def _add_random_delay(self, scheduled_time: datetime.datetime) -> datetime.datetime:
+        """在计划时间上随机延迟1~40秒，防止多群/多用户同时刷屏"""
+        random_adjustment = random.randint(1, 40)
+        return scheduled_time + datetime.timedelta(seconds=random_adjustment)
 
-    async def send_reminder(self, reminder_name: str, reminder_config: Dict[str, Any]):
+    def _build_template_vars(
+        self,
+        reminder_name: str,
+        reminder_config: Dict[str, Any],
+        scheduled_time: datetime.datetime = None,
+    ) -> Dict[str, Any]:
+        """计算本次提醒的模板变量，scheduled_time 为不含随机延迟的计划时间"""
+        base_time = datetime.datetime.strptime(
+            reminder_config.get("time"), "%Y-%m-%d %H:%M:%S"
+        )
+        repeat_interval = self.parse_repeat_interval(
+            reminder_config.get("repeat", "1:00:00:00")
+        )
+        repeat_times = reminder_config.get("repeat_times", 0)
+        # 未给出计划时间时，按当前时间取最近一次已到的计划时间
+        occurrence_time = scheduled_time or datetime.datetime.now()
+
+        # 由计划时间推算是第几次提醒
+        if repeat_interval.total_seconds() > 0 and occurrence_time > base_time:
+            n = (occurrence_time - base_time) // repeat_interval + 1
+        else:
+            n = 1
+        scheduled_time = base_time + repeat_interval * (n - 1)
+
+        variables = dict(reminder_config.get("vars") or {})
+        variables.update(
+            name=reminder_name,
+            date=scheduled_time.strftime("%Y-%m-%d"),
+            time=scheduled_time.strftime("%H:%M"),
+            weekday=WEEKDAYS[scheduled_time.weekday()],
+            n=n,
+            total=repeat_times if repeat_times > 0 else "∞",
+            remaining=max(repeat_times - n, 0) if repeat_times > 0 else "∞",
+        )
+        return variables
+
+    async def send_reminder(
+        self,
+        reminder_name: str,
+        reminder_config: Dict[str, Any],
+        scheduled_time: datetime.datetime = None,
+    ):
         """发送提醒消息，sid可为用户ID或群聊ID"""
         try:
-            message = reminder_config.get("message", "提醒时间到了！")
+            template = self.reminder_templates.get(reminder_name)
+            if template is None:
+                template = self._compile_reminder_template(
+                    reminder_name, reminder_config
+                )
             sids = reminder_config.get("sid", [])
 
-            for sid in sids:
+            # 每次提醒只渲染一次，变量取值相同的sid共用渲染结果
+            if template.is_static:
+                message = template.render_values(())
+                messages = [(sid, message) for sid in sids]
+            else:
+                variables = self._build_template_vars(
+                    reminder_name, reminder_config, scheduled_time
+                )
+                messages = template.render_for_sids(
+                    sids, variables, reminder_config.get("sid_vars")
+                )
+
+            for sid, message in messages:
                 try:
                     # 优先尝试私聊
                     await self.context.send_private_message(sid, message)
@@ -447,31 +538,48 @@ config = {{
 
             now = datetime.datetime.now()
 
+            # 初始调度时编译消息模板并计算首次提醒时间
+            if is_initial:
+                self._compile_reminder_template(reminder_name, reminder_config)
+                if next_time is None:
+                    scheduled_time = self._calculate_scheduled_time(
+                        base_time, repeat_interval
+                    )
+                    next_time = self._add_random_delay(scheduled_time)
+                else:
+                    scheduled_time = next_time
+
             # 如果不是初始调度，需要处理执行逻辑
             if not is_initial:
+                current_info = self._get_reminder_info(reminder_name)
+
                 # 发送提醒
-                await self.send_reminder(reminder_name, reminder_config)
+                await self.send_reminder(
+                    reminder_name, reminder_config, current_info.get("scheduled_time")
+                )
 
                 # 更新已发送次数（仅用于记录，不用于控制逻辑）
-                current_info = self._get_reminder_info(reminder_name)
                 times_sent = current_info.get("times_sent", 0) + 1
                 self._set_reminder_info(reminder_name, times_sent=times_sent)
 
                 # 计算下次提醒时间
                 current_time = current_info.get("next_time")
-                if current_time:
+                current_scheduled = current_info.get("scheduled_time")
+                if current_time and current_scheduled:
                     next_time = current_time + repeat_interval
+                    scheduled_time = current_scheduled + repeat_interval
                 else:
                     # 如果获取不到当前时间，重新计算
-                    next_time = self.calculate_next_reminder_time(
+                    scheduled_time = self._calculate_scheduled_time(
                         base_time, repeat_interval
                     )
+                    next_time = self._add_random_delay(scheduled_time)
 
             # 基于时间的过期检查
             if repeat_times > 0 and repeat_interval.total_seconds() > 0:
                 # 有重复间隔的情况：检查是否超过最后一次提醒时间
                 max_time = base_time + repeat_interval * (repeat_times - 1)
-                if next_time > max_time:
+                if scheduled_time > max_time:
                     logger.info(f"提醒 {reminder_name} 所有提醒已过期，不再发送")
                     # 清理定时器和信息
                     if reminder_name in self.reminder_timers:
@@ -507,7 +615,9 @@ config = {{
             )
 
             self.reminder_timers[reminder_name] = timer
-            self._set_reminder_info(reminder_name, next_time=next_time)
+            self._set_reminder_info(
+                reminder_name, next_time=next_time, scheduled_time=scheduled_time
+            )
 
             if is_initial:
                 logger.info(f"提醒 {reminder_name} 将在 {next_time} 发送")
@@ -529,6 +639,7 @@ config = {{
 
         self.reminder_timers.clear()
         self.reminder_info.clear()
+        self.reminder_templates.clear()
 
     @filter.command("reminder_status")
     async def reminder_status(self, event: AstrMessageEvent):
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+提醒消息模板
+message 中可以使用 {变量} 占位符，提醒加载/添加时编译一次，每次提醒时渲染
+内置变量见 BUILTIN_VARS，自定义变量通过提醒配置的 vars / sid_vars 提供
+"""
+
+import string
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# 内置变量
+BUILTIN_VARS = (
+    "name",  # 提醒名称
+    "date",  # 本次提醒日期 YYYY-MM-DD
+    "time",  # 本次提醒时间 HH:MM
+    "weekday",  # 本次提醒星期，如 周三
+    "n",  # 本次是第几次提醒，从1开始
+    "total",  # 总提醒次数，无限重复时为 ∞
+    "remaining",  # 本次之后剩余的提醒次数，无限重复时为 ∞
+    "sid",  # 当前接收者的sid
+)
+
+# vars / sid_vars 中允许的取值类型
+SCALAR_TYPES = (str, int, float, bool, type(None))
+
+WEEKDAYS = ("周一", "周二", "周三", "周四", "周五", "周六", "周日")
+
+_formatter = string.Formatter()
+
+
+class TemplateError(ValueError):
+    """模板语法错误或引用了未定义的变量"""
+
+
+class MessageTemplate:
+    """预编译的消息模板"""
+
+    __slots__ = ("fields", "_literals", "_specs", "_format")
+
+    def __init__(self, source: str, extra_vars: Iterable[str] = ()):
+        allowed = set(BUILTIN_VARS).union(extra_vars)
+
+        try:
+            parsed = list(_formatter.parse(source))
+        except ValueError as e:
+            raise TemplateError(f"模板语法错误: {e}，字面量花括号请写成 {{{{ 或 }}}}")
+
+        # literals 比 fields 多一个元素，渲染时交替拼接
+        literals: List[str] = [""]
+        fields: List[str] = []
+        specs: List[Tuple[Optional[str], str]] = []
+        for literal, field, spec, conversion in parsed:
+            literals[-1] += literal
+            if field is None:
+                continue
+            if not field.isidentifier():
+                raise TemplateError(f"不支持的占位符: {{{field}}}，只能使用变量名")
+            if field not in allowed:
+                raise TemplateError(
+                    f"未定义的变量: {{{field}}}，可用变量: {', '.join(sorted(allowed))}"
+                )
+            if spec and "{" in spec:
+                raise TemplateError(f"不支持嵌套占位符: {{{field}:{spec}}}")
+            if conversion not in (None, "s", "r", "a"):
+                raise TemplateError(f"不支持的转换符: !{conversion}")
+            fields.append(field)
+            specs.append((conversion, spec or ""))
+            literals.append("")
+
+        self.fields: Tuple[str, ...] = tuple(fields)
+        self._literals = tuple(literals)
+        self._specs = tuple(specs)
+
+        # 编译为按位置取值的格式串，渲染时直接交给 str.format
+        pattern = [_escape(literals[0])]
+        for i in range(len(fields)):
+            pattern.append(self._placeholder(i, i))
+            pattern.append(_escape(literals[i + 1]))
+        self._format = "".join(pattern).format
+
+    def _placeholder(self, index: int, position: int) -> str:
+        """生成第 index 个占位符对应的按位置取值的格式串片段"""
+        conversion, spec = self._specs[index]
+        conversion = f"!{conversion}" if conversion else ""
+        spec = f":{spec}" if spec else ""
+        return f"{{{position}{conversion}{spec}}}"
+
+    @property
+    def is_static(self) -> bool:
+        """模板是否不含任何变量"""
+        return not self.fields
+
+    def _format_value(self, index: int, value: Any) -> str:
+        """按占位符中的转换符和格式说明格式化单个值"""
+        conversion, spec = self._specs[index]
+        if conversion:
+            value = _formatter.convert_field(value, conversion)
+        if not spec:
+            return str(value)
+        try:
+            return format(value, spec)
+        except (ValueError, TypeError):
+            # 格式说明与值类型不符时（如 ∞ 配 02d），退回原样输出
+            return str(value)
+
+    def render_values(self, values: Tuple[Any, ...]) -> str:
+        """按 fields 顺序给出的值渲染模板"""
+        if not self.fields:
+            return self._literals[0]
+        try:
+            return self._format(*values)
+        except (ValueError, TypeError):
+            pass
+        # 格式说明与值类型不符时逐个格式化
+        parts = [self._literals[0]]
+        for i, value in enumerate(values):
+            parts.append(self._format_value(i, value))
+            parts.append(self._literals[i + 1])
+        return "".join(parts)
+
+    def _bind(self, values: List[Any]) -> str:
+        """代入除 sid 外的所有变量，返回只剩 {0} 占位（对应sid）的格式串"""
+        pattern = [_escape(self._literals[0])]
+        for i, field in enumerate(self.fields):
+            if field == "sid":
+                pattern.append(self._placeholder(i, 0))
+            else:
+                pattern.append(_escape(self._format_value(i, values[i])))
+            pattern.append(_escape(self._literals[i + 1]))
+        return "".join(pattern)
+
+    def render_for_sids(
+        self,
+        sids: Iterable[str],
+        variables: Dict[str, Any],
+        sid_vars: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> List[Tuple[str, str]]:
+        """为一次提醒的所有sid渲染消息
+
+        变量取值相同的sid共用同一次渲染结果，返回 [(sid, 消息), ...]
+        """
+        sid_vars = sid_vars or {}
+        fields = self.fields
+        base = [variables.get(f, "") for f in fields]
+        slots: Dict[str, List[int]] = {}
+        for i, f in enumerate(fields):
+            slots.setdefault(f, []).append(i)
+        sid_slots = slots.get("sid", [])
+        # 没有覆盖项的sid：不引用 {sid} 时共用同一条消息，
+        # 否则预先代入本次提醒的变量，每个sid只需填入自己的sid
+        if sid_slots:
+            shared = None
+            bound = self._bind(base).format
+        else:
+            shared = self.render_values(tuple(base))
+
+        cache: Dict[Tuple[Any, ...], str] = {}
+        result = []
+        for sid in sids:
+            overrides = sid_vars.get(sid)
+            if not overrides:
+                if shared is not None:
+                    result.append((sid, shared))
+                    continue
+                try:
+                    result.append((sid, bound(sid)))
+                    continue
+                except (ValueError, TypeError):
+                    # sid的格式说明与其类型不符时，按下方逐个格式化的方式渲染
+                    pass
+            values = base.copy()
+            for i in sid_slots:
+                values[i] = sid
+            if overrides:
+                for f, value in overrides.items():
+                    for i in slots.get(f, ()):
+                        values[i] = value
+            # 键中带上类型，避免 True、1、1.0 相等而共用同一条消息
+            key = (*values, *map(type, values))
+            message = cache.get(key)
+            if message is None:
+                message = cache[key] = self.render_values(tuple(values))
+            result.append((sid, message))
+        return result
+
+
+def _escape(text: str) -> str:
+    """转义字面量中的花括号"""
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+def _check_vars(variables: Any, where: str):
+    """检查变量表为字典且取值均为标量，渲染缓存需要以取值作为键"""
+    if not isinstance(variables, dict):
+        raise TemplateError(f"{where} 必须是字典")
+    for key, value in variables.items():
+        if not isinstance(value, SCALAR_TYPES):
+            raise TemplateError(
+                f"{where} 中的变量 {key} 必须是字符串、数字或布尔值，"
+                f"实际为 {type(value).__name__}"
+            )
+
+
+def template_vars(reminder_config: Dict[str, Any]) -> List[str]:
+    """收集提醒配置中 vars 与 sid_vars 定义的自定义变量名"""
+    names = set(reminder_config.get("vars") or {})
+    for overrides in (reminder_config.get("sid_vars") or {}).values():
+        names.update(overrides)
+    return sorted(names)
+
+
+def compile_reminder_template(reminder_config: Dict[str, Any]) -> MessageTemplate:
+    """编译提醒配置中的 message 模板"""
+    _check_vars(reminder_config.get("vars") or {}, "vars")
+    sid_vars = reminder_config.get("sid_vars") or {}
+    if not isinstance(sid_vars, dict):
+        raise TemplateError("sid_vars 必须是字典")
+    for sid, overrides in sid_vars.items():
+        _check_vars(overrides, f"sid_vars[{sid!r}]")
+    message = reminder_config.get("message", "提醒时间到了！")
+    if not isinstance(message, str):
+        raise TemplateError(f"message 必须是字符串，实际为 {type(message).__name__}")
+    return MessageTemplate(message, template_vars(reminder_config))